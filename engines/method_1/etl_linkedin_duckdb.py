@@ -1,7 +1,10 @@
 import pandas as pd
 import os
+import re
 import duckdb
 import calendar
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 import warnings
 import logging
@@ -12,24 +15,214 @@ warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 # Configurar logging
 logging.basicConfig(level=logging.ERROR)
 
+# Leitor de Excel: calamine quando instalado; senão openpyxl (o pandas já o abre em modo somente leitura)
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_READER_OPTIONS = {"engine": "calamine"}
+except ImportError:
+    EXCEL_READER_OPTIONS = {"engine": "openpyxl"}
+
+# Categoria do arquivo identificada pelo nome (uma única busca por arquivo)
+CATEGORY_PATTERN = re.compile(
+    r"(?P<competitor>competitor)|(?P<content>content)|(?P<followers>followers)|(?P<visitors>visitors)"
+)
+
+# Abas lidas de cada categoria de arquivo
+CATEGORY_KEYS = {
+    "competitor": [{"sheet_name": "competitor", "sheet_pos": 0, "skiprows": 1}],
+    "content": [
+        {"sheet_name": "content_metrics", "sheet_pos": 0, "skiprows": 1},
+        {"sheet_name": "content_posts", "sheet_pos": 1, "skiprows": 1},
+    ],
+    "followers": [
+        {"sheet_name": "followers_new", "sheet_pos": 0, "skiprows": 0},
+        {"sheet_name": "followers_location", "sheet_pos": 1, "skiprows": 0},
+        {"sheet_name": "followers_function", "sheet_pos": 2, "skiprows": 0},
+        {"sheet_name": "followers_experience", "sheet_pos": 3, "skiprows": 0},
+        {"sheet_name": "followers_industry", "sheet_pos": 4, "skiprows": 0},
+        {"sheet_name": "followers_company_size", "sheet_pos": 5, "skiprows": 0},
+    ],
+    "visitors": [
+        {"sheet_name": "visitors_metrics", "sheet_pos": 0, "skiprows": 0},
+        {"sheet_name": "visitors_location", "sheet_pos": 1, "skiprows": 0},
+        {"sheet_name": "visitors_function", "sheet_pos": 2, "skiprows": 0},
+        {"sheet_name": "visitors_experience", "sheet_pos": 3, "skiprows": 0},
+        {"sheet_name": "visitors_industry", "sheet_pos": 4, "skiprows": 0},
+        {"sheet_name": "visitors_company_size", "sheet_pos": 5, "skiprows": 0},
+    ],
+}
+
+# Esquema (coluna: tipo) das tabelas de cada aba
+TABLE_ATTRIBUTES = {
+    "content_metrics": {
+        "Date": "DATE",  # inferir data diretamente
+        "Impressions (organic)": "INT",
+        "Impressions (sponsored)": "INT",
+        "Impressions (total)": "INT",
+        "Unique impressions (organic)": "INT",
+        "Clicks (organic)": "INT",
+        "Clicks (sponsored)": "INT",
+        "Clicks (total)": "INT",
+        "Reactions (organic)": "INT",
+        "Reactions (sponsored)": "INT",
+        "Reactions (total)": "INT",
+        "Comments (organic)": "INT",
+        "Comments (sponsored)": "INT",
+        "Comments (total)": "INT",
+        "Shares (organic)": "INT",
+        "Shares (sponsored)": "INT",
+        "Shares (total)": "INT",
+        "Engagement rate (organic)": "DOUBLE",
+        "Engagement rate (sponsored)": "DOUBLE",
+        "Engagement rate (total)": "DOUBLE",
+    },
+    "content_posts": {
+        "Post Title": "VARCHAR",
+        "Post Link": "VARCHAR",
+        "Post Type": "VARCHAR",
+        "Campaign Name": "VARCHAR",
+        "Published by": "VARCHAR",
+        "Date": "DATE",  # inferir data diretamente
+        "Campaign Start Date": "DATE",  # inferir data diretamente
+        "Campaign End Date": "DATE",  # inferir data diretamente
+        "Audience": "VARCHAR",
+        "Impressions": "INT",
+        "Views (excluding off-site video views)": "INT",
+        "Off-site Views": "INT",
+        "Clicks": "INT",
+        "Click-Through Rate (CTR)": "FLOAT",
+        "Likes": "INT",
+        "Comments": "INT",
+        "Shares": "INT",
+        "Followers": "INT",
+        "Engagement Rate": "FLOAT",
+        "Content Type": "VARCHAR",
+    },
+    "followers_new": {
+        "Date": "DATE",  # inferir data diretamente
+        "Followers Sponsored": "INT",
+        "Followers Organic": "INT",
+        "Total Followers": "INT",
+    },
+    "followers_location": {"Location": "VARCHAR", "Total Followers": "INT"},
+    "followers_function": {"Function": "VARCHAR", "Total Followers": "INT"},
+    "followers_experience": {
+        "Experience Level": "VARCHAR",
+        "Total Followers": "INT",
+    },
+    "followers_industry": {"Industry": "VARCHAR", "Total Followers": "INT"},
+    "followers_company_size": {
+        "Company Size": "VARCHAR",
+        "Total Followers": "INT",
+    },
+    "visitors_metrics": {
+        "Date": "DATE",  # inferir data diretamente
+        "Page Views Overview (Desktop)": "INT",
+        "Page Views Overview (Mobile Devices)": "INT",
+        "Page Views Overview (Total)": "INT",
+        "Unique Visitors Overview (Desktop)": "INT",
+        "Unique Visitors Overview (Mobile Devices)": "INT",
+        "Unique Visitors Overview (Total)": "INT",
+        "Page Views Day by Day (Desktop)": "INT",
+        "Page Views Day by Day (Mobile Devices)": "INT",
+        "Page Views Day by Day (Total)": "INT",
+        "Unique Visitors Day by Day (Desktop)": "INT",
+        "Unique Visitors Day by Day (Mobile Devices)": "INT",
+        "Unique Visitors Day by Day (Total)": "INT",
+        "Page Views Jobs (Desktop)": "INT",
+        "Page Views Jobs (Mobile Devices)": "INT",
+        "Page Views Jobs (Total)": "INT",
+        "Unique Visitors Jobs (Desktop)": "INT",
+        "Unique Visitors Jobs (Mobile Devices)": "INT",
+        "Unique Visitors Jobs (Total)": "INT",
+        "Total Page Views (Desktop)": "INT",
+        "Total Page Views (Mobile Devices)": "INT",
+        "Total Page Views (Total)": "INT",
+        "Total Unique Visitors (Desktop)": "INT",
+        "Total Unique Visitors (Mobile Devices)": "INT",
+        "Total Unique Visitors (Total)": "INT",
+    },
+    "visitors_location": {"Location": "VARCHAR", "Total Views": "INT"},
+    "visitors_function": {"Function": "VARCHAR", "Total Views": "INT"},
+    "visitors_experience": {
+        "Experience Level": "VARCHAR",
+        "Total Views": "INT",
+    },
+    "visitors_industry": {"Industry": "VARCHAR", "Total Views": "INT"},
+    "visitors_company_size": {"Company Size": "VARCHAR", "Total Views": "INT"},
+    "competitor": {
+        "Page": "VARCHAR",
+        "Total Followers": "INT",
+        "New Followers": "INT",
+        "Total Post Engagements": "FLOAT",
+        "Total Posts": "INT",
+    },
+}
+
+# Nomes das colunas de cada tabela, na ordem do esquema
+TABLE_COLUMNS = {
+    name: list(attributes) for name, attributes in TABLE_ATTRIBUTES.items()
+}
+
+# Definição SQL das colunas de cada tabela, usada no CREATE TABLE
+TABLE_DEFINITIONS = {
+    name: ", ".join([f'"{col}" {dtype}' for col, dtype in attributes.items()])
+    for name, attributes in TABLE_ATTRIBUTES.items()
+}
+
+# Número de cada mês a partir do nome em português usado nos diretórios
+MONTH_ORDER_PT = {
+    "Jan": 1,
+    "Fev": 2,
+    "Mar": 3,
+    "Abr": 4,
+    "Maio": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Ago": 8,
+    "Set": 9,
+    "Out": 10,
+    "Nov": 11,
+    "Dez": 12,
+}
+
+# Tipos pandas usados na leitura das abas (datas são convertidas depois)
+PANDAS_DTYPES = {"INT": "Int64", "FLOAT": "Float64", "DOUBLE": "Float64", "VARCHAR": "string"}
+SHEET_DTYPES = {
+    name: {
+        col: PANDAS_DTYPES[dtype]
+        for col, dtype in attributes.items()
+        if dtype in PANDAS_DTYPES
+    }
+    for name, attributes in TABLE_ATTRIBUTES.items()
+}
+
 
 class EtlLinkedinDuckDb:
     """
     Classe responsável pelo processamento ETL (Extração, Transformação e Carga) de dados do LinkedIn.
     """
 
-    def __init__(self, raw_directory, clean_directory):
+    def __init__(self, raw_directory, clean_directory, memory_limit="8GB"):
         """
         Inicializa a classe LinkedInETLProcessor com os diretórios de dados brutos e limpos.
 
         Parâmetros:
         raw_directory (str): Diretório contendo os dados brutos.
         clean_directory (str): Diretório onde os dados limpos serão armazenados.
+        memory_limit (str): Limite de memória da conexão DuckDB (e.g., '8GB').
         """
         self.raw_directory = raw_directory
         self.clean_directory = clean_directory
         self.con = duckdb.connect(database=":memory:")
 
+        # Paralelismo em todos os núcleos; a ordem de inserção não é necessária
+        # nas uniões e exportações, o que libera o DuckDB para paralelizá-las
+        self.con.execute(f"PRAGMA threads={os.cpu_count()}")
+        self.con.execute("PRAGMA preserve_insertion_order=false")
+        self.con.execute(f"PRAGMA memory_limit='{memory_limit}'")
+
     def detect_file_category(self, file):
         """
         Detecta a categoria de um arquivo com base em seu nome.
@@ -40,15 +233,8 @@ class EtlLinkedinDuckDb:
         Retorno:
         str: Categoria do arquivo (competitor, content, followers, visitors) ou 0 se não identificado.
         """
-        if "competitor" in file:
-            return "competitor"
-        elif "content" in file:
-            return "content"
-        elif "followers" in file:
-            return "followers"
-        elif "visitors" in file:
-            return "visitors"
-        return 0
+        match = CATEGORY_PATTERN.search(file)
+        return match.lastgroup if match else 0
 
     def get_raw_files(self, raw_directory):
         """
@@ -61,33 +247,29 @@ class EtlLinkedinDuckDb:
         list: Lista de dicionários com informações sobre os arquivos brutos.
         """
         extraction_files = []
-        for category in os.listdir(raw_directory):
-            category_path = os.path.join(raw_directory, category)
-
-            for year in os.listdir(category_path):
-                year_path = os.path.join(category_path, year)
-
-                for month in os.listdir(year_path):
-                    month_path = os.path.join(year_path, month)
-
-                    monthly_files = os.listdir(month_path)
-                    if not monthly_files:
-                        continue
-
-                    for i, file in enumerate(monthly_files):
-                        file_path = os.path.join(month_path, file)
-                        df_category = self.detect_file_category(file)
-                        extraction_files.append(
-                            {
-                                "category": df_category,
-                                "file_path": file_path,
-                                "dir": [category, year, month],
-                                "extraction_period": f"{year}_{month}_{i+1}",
-                            }
-                        )
+        files_per_month = {}
+        # Uma única varredura: <categoria>/<ano>/<mês>/<arquivo>
+        for entry in Path(raw_directory).glob("*/*/*/*"):
+            if not entry.is_file():
+                continue
+
+            category, year, month, file = entry.relative_to(raw_directory).parts
+            i = files_per_month.get((category, year, month), 0)
+            files_per_month[(category, year, month)] = i + 1
+
+            df_category = self.detect_file_category(file)
+            extraction_files.append(
+                {
+                    "category": df_category,
+                    "file_path": str(entry),
+                    "dir": [category, year, month],
+                    "extraction_period": f"{year}_{month}_{i+1}",
+                }
+            )
         return extraction_files
 
-    def read_excel_file(self, file):
+    @staticmethod
+    def read_excel_file(file):
         """
         Lê um arquivo Excel e retorna seus dados como uma lista de DataFrames.
 
@@ -97,49 +279,31 @@ class EtlLinkedinDuckDb:
         Retorno:
         list: Lista de dicionários contendo o nome do DataFrame, diretório, período de extração e o DataFrame.
         """
-        category_keys = {
-            "competitor": [{"sheet_name": "competitor", "sheet_pos": 0, "skiprows": 1}],
-            "content": [
-                {"sheet_name": "content_metrics", "sheet_pos": 0, "skiprows": 1},
-                {"sheet_name": "content_posts", "sheet_pos": 1, "skiprows": 1},
-            ],
-            "followers": [
-                {"sheet_name": "followers_new", "sheet_pos": 0, "skiprows": 0},
-                {"sheet_name": "followers_location", "sheet_pos": 1, "skiprows": 0},
-                {"sheet_name": "followers_function", "sheet_pos": 2, "skiprows": 0},
-                {"sheet_name": "followers_experience", "sheet_pos": 3, "skiprows": 0},
-                {"sheet_name": "followers_industry", "sheet_pos": 4, "skiprows": 0},
-                {"sheet_name": "followers_company_size", "sheet_pos": 5, "skiprows": 0},
-            ],
-            "visitors": [
-                {"sheet_name": "visitors_metrics", "sheet_pos": 0, "skiprows": 0},
-                {"sheet_name": "visitors_location", "sheet_pos": 1, "skiprows": 0},
-                {"sheet_name": "visitors_function", "sheet_pos": 2, "skiprows": 0},
-                {"sheet_name": "visitors_experience", "sheet_pos": 3, "skiprows": 0},
-                {"sheet_name": "visitors_industry", "sheet_pos": 4, "skiprows": 0},
-                {"sheet_name": "visitors_company_size", "sheet_pos": 5, "skiprows": 0},
-            ],
-        }
-
-        sheets_to_read = category_keys[file["category"]]
+        sheets_to_read = CATEGORY_KEYS[file["category"]]
 
         dataframes = []
-        for sheet in sheets_to_read:
-
-            df = pd.read_excel(
-                file["file_path"],
-                sheet_name=sheet["sheet_pos"],
-                skiprows=sheet["skiprows"],
-            )
-
-            dataframes.append(
-                {
-                    "dataframe_name": sheet["sheet_name"],
-                    "dir": file["dir"],
-                    "extraction_period": file["extraction_period"],
-                    "df": df,
-                }
-            )
+        # Abre o arquivo uma única vez e lê cada aba a partir dele
+        with pd.ExcelFile(file["file_path"], **EXCEL_READER_OPTIONS) as workbook:
+            for sheet in sheets_to_read:
+
+                columns = TABLE_COLUMNS[sheet["sheet_name"]]
+                df = workbook.parse(
+                    sheet_name=sheet["sheet_pos"],
+                    skiprows=sheet["skiprows"],
+                    header=0,
+                    names=columns,
+                    usecols=range(len(columns)),
+                    dtype=SHEET_DTYPES[sheet["sheet_name"]],
+                )
+
+                dataframes.append(
+                    {
+                        "dataframe_name": sheet["sheet_name"],
+                        "dir": file["dir"],
+                        "extraction_period": file["extraction_period"],
+                        "df": df,
+                    }
+                )
 
         return dataframes
 
@@ -153,7 +317,11 @@ class EtlLinkedinDuckDb:
 
         files = self.get_raw_files(self.raw_directory)
 
-        data = [obj for file in files for obj in self.read_excel_file(file)]
+        # Cada arquivo é independente: a leitura é distribuída entre processos
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(self.read_excel_file, files, chunksize=4))
+
+        data = [obj for dataframes in results for obj in dataframes]
         return data
 
     def convert_dataframes_to_duckdb(self, data):
@@ -172,145 +340,57 @@ class EtlLinkedinDuckDb:
             tables.append(table_dict)
         return tables
 
-    def register_dataframe_in_duckdb(self, dataframe):
-        table_attributes = {
-            "content_metrics": {
-                "Date": "DATE",  # inferir data diretamente
-                "Impressions (organic)": "INT",
-                "Impressions (sponsored)": "INT",
-                "Impressions (total)": "INT",
-                "Unique impressions (organic)": "INT",
-                "Clicks (organic)": "INT",
-                "Clicks (sponsored)": "INT",
-                "Clicks (total)": "INT",
-                "Reactions (organic)": "INT",
-                "Reactions (sponsored)": "INT",
-                "Reactions (total)": "INT",
-                "Comments (organic)": "INT",
-                "Comments (sponsored)": "INT",
-                "Comments (total)": "INT",
-                "Shares (organic)": "INT",
-                "Shares (sponsored)": "INT",
-                "Shares (total)": "INT",
-                "Engagement rate (organic)": "DOUBLE",
-                "Engagement rate (sponsored)": "DOUBLE",
-                "Engagement rate (total)": "DOUBLE",
-            },
-            "content_posts": {
-                "Post Title": "VARCHAR",
-                "Post Link": "VARCHAR",
-                "Post Type": "VARCHAR",
-                "Campaign Name": "VARCHAR",
-                "Published by": "VARCHAR",
-                "Date": "DATE",  # inferir data diretamente
-                "Campaign Start Date": "DATE",  # inferir data diretamente
-                "Campaign End Date": "DATE",  # inferir data diretamente
-                "Audience": "VARCHAR",
-                "Impressions": "INT",
-                "Views (excluding off-site video views)": "INT",
-                "Off-site Views": "INT",
-                "Clicks": "INT",
-                "Click-Through Rate (CTR)": "FLOAT",
-                "Likes": "INT",
-                "Comments": "INT",
-                "Shares": "INT",
-                "Followers": "INT",
-                "Engagement Rate": "FLOAT",
-                "Content Type": "VARCHAR",
-            },
-            "followers_new": {
-                "Date": "DATE",  # inferir data diretamente
-                "Followers Sponsored": "INT",
-                "Followers Organic": "INT",
-                "Total Followers": "INT",
-            },
-            "followers_location": {"Location": "VARCHAR", "Total Followers": "INT"},
-            "followers_function": {"Function": "VARCHAR", "Total Followers": "INT"},
-            "followers_experience": {
-                "Experience Level": "VARCHAR",
-                "Total Followers": "INT",
-            },
-            "followers_industry": {"Industry": "VARCHAR", "Total Followers": "INT"},
-            "followers_company_size": {
-                "Company Size": "VARCHAR",
-                "Total Followers": "INT",
-            },
-            "visitors_metrics": {
-                "Date": "DATE",  # inferir data diretamente
-                "Page Views Overview (Desktop)": "INT",
-                "Page Views Overview (Mobile Devices)": "INT",
-                "Page Views Overview (Total)": "INT",
-                "Unique Visitors Overview (Desktop)": "INT",
-                "Unique Visitors Overview (Mobile Devices)": "INT",
-                "Unique Visitors Overview (Total)": "INT",
-                "Page Views Day by Day (Desktop)": "INT",
-                "Page Views Day by Day (Mobile Devices)": "INT",
-                "Page Views Day by Day (Total)": "INT",
-                "Unique Visitors Day by Day (Desktop)": "INT",
-                "Unique Visitors Day by Day (Mobile Devices)": "INT",
-                "Unique Visitors Day by Day (Total)": "INT",
-                "Page Views Jobs (Desktop)": "INT",
-                "Page Views Jobs (Mobile Devices)": "INT",
-                "Page Views Jobs (Total)": "INT",
-                "Unique Visitors Jobs (Desktop)": "INT",
-                "Unique Visitors Jobs (Mobile Devices)": "INT",
-                "Unique Visitors Jobs (Total)": "INT",
-                "Total Page Views (Desktop)": "INT",
-                "Total Page Views (Mobile Devices)": "INT",
-                "Total Page Views (Total)": "INT",
-                "Total Unique Visitors (Desktop)": "INT",
-                "Total Unique Visitors (Mobile Devices)": "INT",
-                "Total Unique Visitors (Total)": "INT",
-            },
-            "visitors_location": {"Location": "VARCHAR", "Total Views": "INT"},
-            "visitors_function": {"Function": "VARCHAR", "Total Views": "INT"},
-            "visitors_experience": {
-                "Experience Level": "VARCHAR",
-                "Total Views": "INT",
-            },
-            "visitors_industry": {"Industry": "VARCHAR", "Total Views": "INT"},
-            "visitors_company_size": {"Company Size": "VARCHAR", "Total Views": "INT"},
-            "competitor": {
-                "Page": "VARCHAR",
-                "Total Followers": "INT",
-                "New Followers": "INT",
-                "Total Post Engagements": "FLOAT",
-                "Total Posts": "INT",
-            },
-        }
+    def add_final_date(self, dataframe):
+        """
+        Adiciona uma data final ao DataFrame com base no período de extração.
 
-        db_table_name = (
-            f"{dataframe['dataframe_name']}_{dataframe['extraction_period']}"
-        )
-        table_attribute = table_attributes.get(dataframe["dataframe_name"])
+        Parâmetros:
+        dataframe (dict): Dicionário contendo o DataFrame e suas informações.
 
-        translated_columns = table_attribute.keys()
-        dataframe["df"].columns = list(translated_columns)
+        Retorno:
+        dict: O mesmo dicionário com a data final adicionada.
+        """
+        extraction_period = dataframe["extraction_period"]
+        year, month, period = extraction_period.split("_")
+        month = MONTH_ORDER_PT[month]
 
-        self.con.register("temp_table", dataframe["df"])
+        if period == "2":
+            day = calendar.monthrange(int(year), int(month))[1]
+        else:
+            day = 15
+
+        dataframe["df"]["Extraction Range"] = pd.Timestamp(int(year), month, day)
+        return dataframe
 
-        columns_definition = ", ".join(
-            [f'"{col}" {dtype}' for col, dtype in table_attribute.items()]
+    def register_dataframe_in_duckdb(self, dataframe):
+        db_table_name = (
+            f"{dataframe['dataframe_name']}_{dataframe['extraction_period']}"
         )
-        create_table_query = f"CREATE TABLE {db_table_name} ({columns_definition});"
-        self.con.execute(create_table_query)
+        table_attribute = TABLE_ATTRIBUTES.get(dataframe["dataframe_name"])
 
-        insert_query = f"INSERT INTO {db_table_name} SELECT "
+        # Converter as datas no pandas (vetorizado) em vez de STRPTIME linha a linha
         for col, dtype in table_attribute.items():
             if dtype == "DATE":
-                insert_query += f'CASE WHEN "{col}" IS NULL OR "{col}" = \'\' THEN NULL ELSE STRPTIME(CAST("{col}" AS VARCHAR), \'%m/%d/%Y\') END AS "{col}", '
-            else:
-                insert_query += f'"{col}", '
+                dataframe["df"][col] = pd.to_datetime(
+                    dataframe["df"][col], format="%m/%d/%Y", errors="coerce"
+                )
+
+        # A data final entra junto com a carga, sem ALTER TABLE + UPDATE depois
+        dataframe = self.add_final_date(dataframe)
 
-        insert_query = insert_query.rstrip(", ") + " FROM temp_table;"
+        columns_definition = TABLE_DEFINITIONS[dataframe["dataframe_name"]]
+        create_table_query = f'CREATE TABLE {db_table_name} ({columns_definition}, "Extraction Range" DATE);'
+        self.con.execute(create_table_query)
 
-        self.con.execute(insert_query)
+        # Carga direta do DataFrame (Appender), sem registrar tabela temporária
+        self.con.append(db_table_name, dataframe["df"])
 
         table_dict = {
             "dataframe_name": dataframe["dataframe_name"],
             "extraction_period": dataframe["extraction_period"],
             "db_table_name": db_table_name,
             "export_dir": os.path.join(self.clean_directory, *dataframe["dir"]),
+            "num_rows": len(dataframe["df"]),
         }
 
         return table_dict
@@ -326,82 +406,28 @@ class EtlLinkedinDuckDb:
         int: Retorna 1 se o processamento for bem-sucedido.
         """
 
+        # Valores finais calculados em uma única consulta: valores negativos são
+        # substituídos pela média móvel (janela de 3 dias) dos valores positivos
         self.con.execute(
             f"""
             CREATE TABLE {table}_temp AS
-            SELECT *,
-                CASE WHEN "Reactions (total)" >= 0 THEN "Reactions (total)" ELSE 0 END AS "Reactions (positive)",
-                CASE WHEN "Comments (total)" >= 0 THEN "Comments (total)" ELSE 0 END AS "Comments (positive)",
-                CASE WHEN "Shares (total)" >= 0 THEN "Shares (total)" ELSE 0 END AS "Shares (positive)",
-                CASE WHEN "Clicks (total)" >= 0 THEN "Clicks (total)" ELSE 0 END AS "Clicks (positive)"
+            SELECT "Date",
+                CASE WHEN "Reactions (total)" >= 0 THEN "Reactions (total)"
+                    ELSE AVG(CASE WHEN "Reactions (total)" >= 0 THEN "Reactions (total)" ELSE 0 END) OVER moving_window
+                END AS "Reactions (final)",
+                CASE WHEN "Comments (total)" >= 0 THEN "Comments (total)"
+                    ELSE AVG(CASE WHEN "Comments (total)" >= 0 THEN "Comments (total)" ELSE 0 END) OVER moving_window
+                END AS "Comments (final)",
+                CASE WHEN "Shares (total)" >= 0 THEN "Shares (total)"
+                    ELSE AVG(CASE WHEN "Shares (total)" >= 0 THEN "Shares (total)" ELSE 0 END) OVER moving_window
+                END AS "Shares (final)",
+                CASE WHEN "Clicks (total)" >= 0 THEN "Clicks (total)"
+                    ELSE AVG(CASE WHEN "Clicks (total)" >= 0 THEN "Clicks (total)" ELSE 0 END) OVER moving_window
+                END AS "Clicks (final)"
             FROM {table}
-        """
-        )
-
-        # Adicionar colunas para média móvel na tabela temporária auxiliar
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Reactions (moving average)" DOUBLE"""
-        )
-
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Comments (moving average)" DOUBLE"""
-        )
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Shares (moving average)" DOUBLE"""
-        )
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Clicks (moving average)" DOUBLE"""
-        )
-
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Reactions (final)" DOUBLE"""
-        )
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Comments (final)" DOUBLE"""
-        )
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Shares (final)" DOUBLE"""
-        )
-        self.con.execute(
-            f"""
-            ALTER TABLE {table}_temp
-            ADD COLUMN "Clicks (final)" DOUBLE"""
-        )
-
-        # Calculando média móvel na tabela temporária auxiliar
-        self.con.execute(
-            f"""
-            UPDATE {table}_temp
-            SET "Reactions (moving average)" = (SELECT AVG("Reactions (positive)") FROM {table}_temp t2 WHERE t2."Date" BETWEEN t1."Date" - 2 AND t1."Date"),
-                "Comments (moving average)" = (SELECT AVG("Comments (positive)") FROM {table}_temp t2 WHERE t2."Date" BETWEEN t1."Date" - 2 AND t1."Date"),
-                "Shares (moving average)" = (SELECT AVG("Shares (positive)") FROM {table}_temp t2 WHERE t2."Date" BETWEEN t1."Date" - 2 AND t1."Date"),
-                "Clicks (moving average)" = (SELECT AVG("Clicks (positive)") FROM {table}_temp t2 WHERE t2."Date" BETWEEN t1."Date" - 2 AND t1."Date")
-            FROM {table}_temp t1
-        """
-        )
-
-        # Colunas finais na tabela temporária auxiliar
-        self.con.execute(
-            f"""
-            UPDATE {table}_temp
-            SET "Reactions (final)" = CASE WHEN "Reactions (total)" >= 0 THEN "Reactions (total)" ELSE "Reactions (moving average)" END,
-                "Comments (final)" = CASE WHEN "Comments (total)" >= 0 THEN "Comments (total)" ELSE "Comments (moving average)" END,
-                "Shares (final)" = CASE WHEN "Shares (total)" >= 0 THEN "Shares (total)" ELSE "Shares (moving average)" END,
-                "Clicks (final)" = CASE WHEN "Clicks (total)" >= 0 THEN "Clicks (total)" ELSE "Clicks (moving average)" END
+            WINDOW moving_window AS (
+                ORDER BY "Date" RANGE BETWEEN INTERVAL 2 DAYS PRECEDING AND CURRENT ROW
+            )
         """
         )
 
@@ -423,56 +449,6 @@ class EtlLinkedinDuckDb:
 
         return 1
 
-    def add_final_date(self, table):
-        """
-        Adiciona uma data final a tabela com base no período de extração.
-
-        Parâmetros:
-        table: Dicionário contendo o informações da tabela.
-
-        Retorno:
-        dict: O mesmo dicionário com a data final adicionada.
-        """
-
-        extraction_period = table["extraction_period"]
-        year, month, period = extraction_period.split("_")
-
-        month_order_pt = {
-            "Jan": 1,
-            "Fev": 2,
-            "Mar": 3,
-            "Abr": 4,
-            "Maio": 5,
-            "Jun": 6,
-            "Jul": 7,
-            "Ago": 8,
-            "Set": 9,
-            "Out": 10,
-            "Nov": 11,
-            "Dez": 12,
-        }
-        month = month_order_pt[month]
-
-        if period == "2":
-            day = calendar.monthrange(int(year), int(month))[1]
-        else:
-            day = 15
-
-        final_date = f"{year}-{month}-{day}"
-
-        self.con.execute(
-            f"""
-            ALTER TABLE {table["db_table_name"]} ADD COLUMN IF NOT EXISTS "Extraction Range" DATE
-        """
-        )
-        self.con.execute(
-            f"""
-            UPDATE {table["db_table_name"]} SET "Extraction Range" = '{final_date}'
-        """
-        )
-
-        return 1
-
     def transform_data(self, tables):
         """
         Aplica uma série de transformações aos dados extraídos.
@@ -486,8 +462,6 @@ class EtlLinkedinDuckDb:
         for table in tables:
             if table["dataframe_name"] == "content_metrics":
                 self.process_content_metrics(table["db_table_name"])
-
-            self.add_final_date(table)
         return tables
 
     def load_to_clean(self, tables):
@@ -500,14 +474,53 @@ class EtlLinkedinDuckDb:
         Retorno:
         int: Retorna 1 se a carga for bem-sucedida.
         """
-        for table in tables:
-            if not os.path.exists(table["export_dir"]):
-                os.makedirs(table["export_dir"])
+        if not os.path.exists(self.clean_directory):
+            os.makedirs(self.clean_directory)
 
-            export_filename = table["db_table_name"] + ".csv"
-            self.con.execute(
-                f"COPY {table['db_table_name']} TO '{table['export_dir']}/{export_filename}' (HEADER, DELIMITER ';')"
-            )
+        grouped_tables = {}
+        for table in tables:
+            grouped_tables.setdefault(table["dataframe_name"], []).append(table)
+
+        # Um único COPY particionado por categoria, em vez de um COPY por extração.
+        # Cada extração é gravada em <categoria>/extraction_period=<período>/
+        for dataframe_name, category_tables in grouped_tables.items():
+            export_dir = os.path.join(self.clean_directory, dataframe_name)
+            tables_with_rows = [table for table in category_tables if table["num_rows"]]
+
+            if tables_with_rows:
+                # Os períodos são passados como parâmetros, não interpolados no SQL
+                union_all_query = " UNION ALL ".join(
+                    f'SELECT *, ? AS extraction_period FROM "{table["db_table_name"]}"'
+                    for table in tables_with_rows
+                )
+                extraction_periods = [
+                    table["extraction_period"] for table in tables_with_rows
+                ]
+
+                self.con.execute(
+                    f"""
+                    COPY ({union_all_query}) TO '{export_dir}'
+                    (FORMAT PARQUET, COMPRESSION 'zstd', ROW_GROUP_SIZE 100000, PARTITION_BY (extraction_period), OVERWRITE_OR_IGNORE)
+                """,
+                    extraction_periods,
+                )
+
+            # O COPY particionado não cria partição para extrações sem linhas:
+            # cada uma recebe seu próprio arquivo, só com o esquema
+            for table in category_tables:
+                if table["num_rows"]:
+                    continue
+
+                partition_dir = os.path.join(
+                    export_dir, f"extraction_period={table['extraction_period']}"
+                )
+                os.makedirs(partition_dir, exist_ok=True)
+                self.con.execute(
+                    f"""
+                    COPY "{table["db_table_name"]}" TO '{os.path.join(partition_dir, "data_0.parquet")}'
+                    (FORMAT PARQUET, COMPRESSION 'zstd')
+                """
+                )
 
         return 1
 
@@ -536,44 +549,62 @@ class EtlLinkedinDuckDb:
 
             monthly_data[category_year_month]["tables"].append(table["db_table_name"])
 
+        # Tabelas mensais são views: não duplicam os dados das extrações
         for category_year_month, grouped_data in monthly_data.items():
             table_name = category_year_month
-            table_1 = grouped_data["tables"][0]
-            table_2 = grouped_data["tables"][1]
+            union_all_query = " UNION ALL ".join(
+                f'SELECT * FROM "{table}"' for table in grouped_data["tables"]
+            )
 
             self.con.execute(
                 f"""
-                CREATE OR REPLACE TABLE "{table_name}" AS
-                SELECT * FROM "{table_1}"
-                UNION ALL
-                SELECT * FROM "{table_2}"
+                CREATE OR REPLACE VIEW "{table_name}" AS
+                {union_all_query}
             """
             )
 
         return monthly_data
 
-    def export_tables(self, tables, export_type):
+    def export_tables(self, tables, export_type, file_format="csv"):
         """
-        Exporta um DataFrame concatenado para um arquivo CSV.
+        Exporta um DataFrame concatenado para um arquivo CSV ou Parquet.
 
         Parâmetros:
         tables (dict): Dicionário contendo as tabelas a serem exportadas.
         export_type (str): Tipo de exportação (e.g., 'month', 'clean').
+        file_format (str): Formato do arquivo exportado ('csv' ou 'parquet').
 
         Retorno:
         int: Retorna 1 se a exportação for bem-sucedida.
         """
+        copy_options = {
+            "csv": "HEADER, DELIMITER ';'",
+            "parquet": "FORMAT PARQUET, COMPRESSION 'zstd', ROW_GROUP_SIZE 100000",
+        }
+
         for table_name, table_atributes in tables.items():
 
             if not os.path.exists(table_atributes["export_dir"]):
                 os.makedirs(table_atributes["export_dir"])
 
-            export_filename = f"{export_type}_{table_name}.csv"
+            export_filename = f"{export_type}_{table_name}.{file_format}"
             self.con.execute(
-                f"COPY {table_name} TO '{table_atributes['export_dir']}/{export_filename}' (HEADER, DELIMITER ';')"
+                f"COPY {table_name} TO '{table_atributes['export_dir']}/{export_filename}' ({copy_options[file_format]})"
             )
         return 1
 
+    def to_arrow(self, table_name):
+        """
+        Retorna uma tabela DuckDB como tabela Arrow, sem passar por arquivo CSV.
+
+        Parâmetros:
+        table_name (str): Nome da tabela a ser retornada.
+
+        Retorno:
+        pyarrow.Table: Dados da tabela, prontos para uso em pandas ou polars.
+        """
+        return self.con.execute(f'SELECT * FROM "{table_name}"').fetch_arrow_table()
+
     def concatenate_category_tables(self, monthly_data):
         """
         Identifica e agrupa tabelas de mesma categoria.
@@ -596,18 +627,17 @@ class EtlLinkedinDuckDb:
                     "tables": [],
                 }
 
-            grouped_data_category[grouped_data["category"]]["tables"].append(
-                category_year_month
+            grouped_data_category[grouped_data["category"]]["tables"].extend(
+                grouped_data["tables"]
             )
 
+        # A tabela da categoria é montada direto das tabelas de cada extração
         for category, grouped_data in grouped_data_category.items():
             table_name = category
 
-            union_all_query = ""
-            for table in grouped_data["tables"]:
-                union_all_query += f'SELECT * FROM "{table}" UNION ALL '
-
-            union_all_query = union_all_query.rstrip(" UNION ALL ")
+            union_all_query = " UNION ALL ".join(
+                f'SELECT * FROM "{table}"' for table in grouped_data["tables"]
+            )
 
             self.con.execute(
                 f"""
@@ -630,7 +660,7 @@ def main():
     etl.load_to_clean(tables)
 
     monthly_tables = etl.concatenate_monthly_tables(tables)
-    etl.export_tables(monthly_tables, "month")
+    etl.export_tables(monthly_tables, "month", file_format="parquet")
 
     category_tables = etl.concatenate_category_tables(monthly_tables)
     etl.export_tables(category_tables, "all_extractions")
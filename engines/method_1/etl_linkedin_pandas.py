@@ -1,12 +1,251 @@
 import pandas as pd
+from pandas.api.types import union_categoricals
 import os
+import re
 import csv
 import calendar
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import warnings
 
 warnings.simplefilter("ignore")
 
+# Leitor de Excel: calamine quando instalado; senão openpyxl (o pandas já o abre em modo somente leitura)
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_READER_OPTIONS = {"engine": "calamine"}
+except ImportError:
+    EXCEL_READER_OPTIONS = {"engine": "openpyxl"}
+
+# Categoria do arquivo identificada pelo nome (uma única busca por arquivo)
+CATEGORY_PATTERN = re.compile(
+    r"(?P<competitor>competitor)|(?P<content>content)|(?P<followers>followers)|(?P<visitors>visitors)"
+)
+
+# Abas lidas de cada categoria de arquivo (usecols: posições das colunas mantidas)
+CATEGORY_KEYS = {
+    "competitor": [{"sheet_name": "competitor", "sheet_pos": 0, "skiprows": 1}],
+    "content": [
+        {
+            "sheet_name": "content_metrics",
+            "sheet_pos": 0,
+            "skiprows": 1,
+            "usecols": (0, 3, 7, 10, 13, 16),
+        },
+        {"sheet_name": "content_posts", "sheet_pos": 1, "skiprows": 1},
+    ],
+    "followers": [
+        {"sheet_name": "followers_new", "sheet_pos": 0, "skiprows": 0},
+        {"sheet_name": "followers_location", "sheet_pos": 1, "skiprows": 0},
+        {"sheet_name": "followers_function", "sheet_pos": 2, "skiprows": 0},
+        {"sheet_name": "followers_experience", "sheet_pos": 3, "skiprows": 0},
+        {"sheet_name": "followers_industry", "sheet_pos": 4, "skiprows": 0},
+        {"sheet_name": "followers_company_size", "sheet_pos": 5, "skiprows": 0},
+    ],
+    "visitors": [
+        {"sheet_name": "visitors_metrics", "sheet_pos": 0, "skiprows": 0},
+        {"sheet_name": "visitors_location", "sheet_pos": 1, "skiprows": 0},
+        {"sheet_name": "visitors_function", "sheet_pos": 2, "skiprows": 0},
+        {"sheet_name": "visitors_experience", "sheet_pos": 3, "skiprows": 0},
+        {"sheet_name": "visitors_industry", "sheet_pos": 4, "skiprows": 0},
+        {"sheet_name": "visitors_company_size", "sheet_pos": 5, "skiprows": 0},
+    ],
+}
+
+# Nomes das colunas (em inglês) de cada aba
+TRANSLATED_COLUMNS = {
+    "content_metrics": [
+        "Date",
+        "Impressions (organic)",
+        "Impressions (sponsored)",
+        "Impressions (total)",
+        "Unique impressions (organic)",
+        "Clicks (organic)",
+        "Clicks (sponsored)",
+        "Clicks (total)",
+        "Reactions (organic)",
+        "Reactions (sponsored)",
+        "Reactions (total)",
+        "Comments (organic)",
+        "Comments (sponsored)",
+        "Comments (total)",
+        "Shares (organic)",
+        "Shares (sponsored)",
+        "Shares (total)",
+        "Engagement rate (organic)",
+        "Engagement rate (sponsored)",
+        "Engagement rate (total)",
+    ],
+    "content_posts": [
+        "Post Title",
+        "Post Link",
+        "Post Type",
+        "Campaign Name",
+        "Published by",
+        "Date",
+        "Campaign Start Date",
+        "Campaign End Date",
+        "Audience",
+        "Impressions",
+        "Views (excluding off-site video views)",
+        "Off-site Views",
+        "Clicks",
+        "Click-Through Rate (CTR)",
+        "Likes",
+        "Comments",
+        "Shares",
+        "Followers",
+        "Engagement Rate",
+        "Content Type",
+    ],
+    "followers_new": [
+        "Date",
+        "Followers Sponsored",
+        "Followers Organic",
+        "Total Followers",
+    ],
+    "followers_location": ["Location", "Total Followers"],
+    "followers_function": ["Function", "Total Followers"],
+    "followers_experience": ["Experience Level", "Total Followers"],
+    "followers_industry": ["Industry", "Total Followers"],
+    "followers_company_size": ["Company Size", "Total Followers"],
+    "visitors_metrics": [
+        "Date",
+        "Page Views Overview (Desktop)",
+        "Page Views Overview (Mobile Devices)",
+        "Page Views Overview (Total)",
+        "Unique Visitors Overview (Desktop)",
+        "Unique Visitors Overview (Mobile Devices)",
+        "Unique Visitors Overview (Total)",
+        "Page Views Day by Day (Desktop)",
+        "Page Views Day by Day (Mobile Devices)",
+        "Page Views Day by Day (Total)",
+        "Unique Visitors Day by Day (Desktop)",
+        "Unique Visitors Day by Day (Mobile Devices)",
+        "Unique Visitors Day by Day (Total)",
+        "Page Views Jobs (Desktop)",
+        "Page Views Jobs (Mobile Devices)",
+        "Page Views Jobs (Total)",
+        "Unique Visitors Jobs (Desktop)",
+        "Unique Visitors Jobs (Mobile Devices)",
+        "Unique Visitors Jobs (Total)",
+        "Total Page Views (Desktop)",
+        "Total Page Views (Mobile Devices)",
+        "Total Page Views (Total)",
+        "Total Unique Visitors (Desktop)",
+        "Total Unique Visitors (Mobile Devices)",
+        "Total Unique Visitors (Total)",
+    ],
+    "visitors_location": ["Location", "Total Views"],
+    "visitors_function": ["Function", "Total Views"],
+    "visitors_experience": ["Experience Level", "Total Views"],
+    "visitors_industry": ["Industry", "Total Views"],
+    "visitors_company_size": ["Company Size", "Total Views"],
+    "competitor": [
+        "Page",
+        "Total Followers",
+        "New Followers",
+        "Total Post Engagements",
+        "Total Posts",
+    ],
+}
+
+# Colunas de data de cada aba ("Extraction Range" já é criada como datetime)
+DATE_COLUMNS = {
+    "content_metrics": ("Date",),
+    "content_posts": ("Date", "Campaign Start Date", "Campaign End Date"),
+    "followers_new": ("Date",),
+    "visitors_metrics": ("Date",),
+}
+
+# Colunas de métricas (contagens) de cada aba, armazenadas como Int32
+METRIC_COLUMNS = {
+    "content_metrics": (
+        "Impressions (total)",
+        "Clicks (total)",
+        "Reactions (total)",
+        "Comments (total)",
+        "Shares (total)",
+    ),
+    "content_posts": (
+        "Impressions",
+        "Views (excluding off-site video views)",
+        "Off-site Views",
+        "Clicks",
+        "Likes",
+        "Comments",
+        "Shares",
+        "Followers",
+    ),
+    "followers_new": ("Followers Sponsored", "Followers Organic", "Total Followers"),
+    "followers_location": ("Total Followers",),
+    "followers_function": ("Total Followers",),
+    "followers_experience": ("Total Followers",),
+    "followers_industry": ("Total Followers",),
+    "followers_company_size": ("Total Followers",),
+    "visitors_metrics": tuple(TRANSLATED_COLUMNS["visitors_metrics"][1:]),
+    "visitors_location": ("Total Views",),
+    "visitors_function": ("Total Views",),
+    "visitors_experience": ("Total Views",),
+    "visitors_industry": ("Total Views",),
+    "visitors_company_size": ("Total Views",),
+    "competitor": ("Total Followers", "New Followers", "Total Posts"),
+}
+
+# Colunas de texto com poucos valores distintos, armazenadas como categóricas
+CATEGORICAL_COLUMNS = {
+    "followers_location": ["Location"],
+    "followers_function": ["Function"],
+    "followers_experience": ["Experience Level"],
+    "followers_industry": ["Industry"],
+    "followers_company_size": ["Company Size"],
+    "visitors_location": ["Location"],
+    "visitors_function": ["Function"],
+    "visitors_experience": ["Experience Level"],
+    "visitors_industry": ["Industry"],
+    "visitors_company_size": ["Company Size"],
+    "competitor": ["Page"],
+}
+
+# Número de cada mês a partir do nome em português usado nos diretórios
+MONTH_ORDER_PT = {
+    "Jan": 1,
+    "Fev": 2,
+    "Mar": 3,
+    "Abr": 4,
+    "Maio": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Ago": 8,
+    "Set": 9,
+    "Out": 10,
+    "Nov": 11,
+    "Dez": 12,
+}
+
+
+@lru_cache(maxsize=None)
+def get_translated_columns(dataframe_name, usecols=None):
+    """
+    Retorna o índice de colunas traduzidas de uma aba, criado uma única vez por aba.
+
+    Parâmetros:
+    dataframe_name (str): Nome da aba (e.g., 'content_metrics').
+    usecols (tuple): Posições das colunas lidas, ou None se a aba foi lida inteira.
+
+    Retorno:
+    pd.Index: Nomes das colunas em inglês.
+    """
+    columns = TRANSLATED_COLUMNS[dataframe_name]
+
+    # Abas lidas parcialmente recebem apenas os nomes das colunas lidas
+    if usecols is not None:
+        columns = [columns[i] for i in usecols]
+
+    return pd.Index(columns)
+
 
 class EtlLinkedinPandas:
     """
@@ -23,6 +262,18 @@ class EtlLinkedinPandas:
         """
         self.raw_directory = raw_directory
         self.clean_directory = clean_directory
+        self.created_directories = set()
+
+    def make_directory(self, directory):
+        """
+        Cria um diretório de saída, caso ainda não tenha sido criado por esta instância.
+
+        Parâmetros:
+        directory (str): Caminho do diretório.
+        """
+        if directory not in self.created_directories:
+            os.makedirs(directory, exist_ok=True)
+            self.created_directories.add(directory)
 
     def detect_file_category(self, file):
         """
@@ -34,15 +285,41 @@ class EtlLinkedinPandas:
         Retorno:
         str: Categoria do arquivo (competitor, content, followers, visitors) ou 0 se não identificado.
         """
-        if "competitor" in file:
-            return "competitor"
-        elif "content" in file:
-            return "content"
-        elif "followers" in file:
-            return "followers"
-        elif "visitors" in file:
-            return "visitors"
-        return 0
+        match = CATEGORY_PATTERN.search(file)
+        return match.lastgroup if match else 0
+
+    def get_category_files(self, category_entry):
+        """
+        Lista os arquivos brutos de uma categoria (<categoria>/<ano>/<mês>/<arquivo>).
+
+        Parâmetros:
+        category_entry (os.DirEntry): Diretório da categoria.
+
+        Retorno:
+        list: Lista de dicionários com informações sobre os arquivos brutos da categoria.
+        """
+        category = category_entry.name
+        category_files = []
+        with os.scandir(category_entry.path) as years:
+            for year in years:
+                with os.scandir(year.path) as months:
+                    for month in months:
+                        with os.scandir(month.path) as monthly_files:
+                            for i, file in enumerate(monthly_files):
+                                category_files.append(
+                                    {
+                                        "category": self.detect_file_category(
+                                            file.name
+                                        ),
+                                        "file_path": file.path,
+                                        "dir": [category, year.name, month.name],
+                                        "extraction_period": f"{year.name}-{month.name}-{i+1}",
+                                        "final_date": self.get_final_date(
+                                            year.name, month.name, i + 1
+                                        ),
+                                    }
+                                )
+        return category_files
 
     def get_raw_files(self, raw_directory):
         """
@@ -54,34 +331,18 @@ class EtlLinkedinPandas:
         Retorno:
         list: Lista de dicionários com informações sobre os arquivos brutos.
         """
-        extraction_files = []
-        for category in os.listdir(raw_directory):
-            category_path = os.path.join(raw_directory, category)
-
-            for year in os.listdir(category_path):
-                year_path = os.path.join(category_path, year)
-
-                for month in os.listdir(year_path):
-                    month_path = os.path.join(year_path, month)
-
-                    monthly_files = os.listdir(month_path)
-                    if not monthly_files:
-                        continue
-
-                    for i, file in enumerate(monthly_files):
-                        file_path = os.path.join(month_path, file)
-                        df_category = self.detect_file_category(file)
-                        extraction_files.append(
-                            {
-                                "category": df_category,
-                                "file_path": file_path,
-                                "dir": [category, year, month],
-                                "extraction_period": f"{year}-{month}-{i+1}",
-                            }
-                        )
+        with os.scandir(raw_directory) as entries:
+            categories = [entry for entry in entries if entry.is_dir()]
+
+        # Listagem de diretórios libera o GIL: uma thread por categoria
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            files_per_category = list(executor.map(self.get_category_files, categories))
+
+        extraction_files = [file for files in files_per_category for file in files]
         return extraction_files
 
-    def read_excel_file(self, file):
+    @staticmethod
+    def read_excel_file(file):
         """
         Lê um arquivo Excel e retorna seus dados como uma lista de DataFrames.
 
@@ -91,49 +352,29 @@ class EtlLinkedinPandas:
         Retorno:
         list: Lista de dicionários contendo o nome do DataFrame, diretório, período de extração e o DataFrame.
         """
-        category_keys = {
-            "competitor": [{"sheet_name": "competitor", "sheet_pos": 0, "skiprows": 1}],
-            "content": [
-                {"sheet_name": "content_metrics", "sheet_pos": 0, "skiprows": 1},
-                {"sheet_name": "content_posts", "sheet_pos": 1, "skiprows": 1},
-            ],
-            "followers": [
-                {"sheet_name": "followers_new", "sheet_pos": 0, "skiprows": 0},
-                {"sheet_name": "followers_location", "sheet_pos": 1, "skiprows": 0},
-                {"sheet_name": "followers_function", "sheet_pos": 2, "skiprows": 0},
-                {"sheet_name": "followers_experience", "sheet_pos": 3, "skiprows": 0},
-                {"sheet_name": "followers_industry", "sheet_pos": 4, "skiprows": 0},
-                {"sheet_name": "followers_company_size", "sheet_pos": 5, "skiprows": 0},
-            ],
-            "visitors": [
-                {"sheet_name": "visitors_metrics", "sheet_pos": 0, "skiprows": 0},
-                {"sheet_name": "visitors_location", "sheet_pos": 1, "skiprows": 0},
-                {"sheet_name": "visitors_function", "sheet_pos": 2, "skiprows": 0},
-                {"sheet_name": "visitors_experience", "sheet_pos": 3, "skiprows": 0},
-                {"sheet_name": "visitors_industry", "sheet_pos": 4, "skiprows": 0},
-                {"sheet_name": "visitors_company_size", "sheet_pos": 5, "skiprows": 0},
-            ],
-        }
-
-        sheets_to_read = category_keys[file["category"]]
+        sheets_to_read = CATEGORY_KEYS[file["category"]]
 
         dataframes = []
-        for sheet in sheets_to_read:
-
-            df = pd.read_excel(
-                file["file_path"],
-                sheet_name=sheet["sheet_pos"],
-                skiprows=sheet["skiprows"],
-            )
-
-            dataframes.append(
-                {
-                    "dataframe_name": sheet["sheet_name"],
-                    "dir": file["dir"],
-                    "extraction_period": file["extraction_period"],
-                    "df": df,
-                }
-            )
+        # Abre o arquivo uma única vez e lê cada aba a partir dele
+        with pd.ExcelFile(file["file_path"], **EXCEL_READER_OPTIONS) as workbook:
+            for sheet in sheets_to_read:
+
+                df = workbook.parse(
+                    sheet_name=sheet["sheet_pos"],
+                    skiprows=sheet["skiprows"],
+                    usecols=sheet.get("usecols"),
+                )
+
+                dataframes.append(
+                    {
+                        "dataframe_name": sheet["sheet_name"],
+                        "dir": file["dir"],
+                        "extraction_period": file["extraction_period"],
+                        "final_date": file["final_date"],
+                        "usecols": sheet.get("usecols"),
+                        "df": df,
+                    }
+                )
 
         return dataframes
 
@@ -147,7 +388,11 @@ class EtlLinkedinPandas:
 
         files = self.get_raw_files(self.raw_directory)
 
-        data = [obj for file in files for obj in self.read_excel_file(file)]
+        # Cada arquivo é independente: a leitura é distribuída entre processos
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(self.read_excel_file, files, chunksize=4))
+
+        data = [obj for dataframes in results for obj in dataframes]
         return data
 
     def translate_cols(self, dataframe):
@@ -160,143 +405,45 @@ class EtlLinkedinPandas:
         Retorno:
         dict: O mesmo dicionário com os nomes das colunas traduzidos.
         """
-        translated_columns = {
-            "content_metrics": [
-                "Date",
-                "Impressions (organic)",
-                "Impressions (sponsored)",
-                "Impressions (total)",
-                "Unique impressions (organic)",
-                "Clicks (organic)",
-                "Clicks (sponsored)",
-                "Clicks (total)",
-                "Reactions (organic)",
-                "Reactions (sponsored)",
-                "Reactions (total)",
-                "Comments (organic)",
-                "Comments (sponsored)",
-                "Comments (total)",
-                "Shares (organic)",
-                "Shares (sponsored)",
-                "Shares (total)",
-                "Engagement rate (organic)",
-                "Engagement rate (sponsored)",
-                "Engagement rate (total)",
-            ],
-            "content_posts": [
-                "Post Title",
-                "Post Link",
-                "Post Type",
-                "Campaign Name",
-                "Published by",
-                "Date",
-                "Campaign Start Date",
-                "Campaign End Date",
-                "Audience",
-                "Impressions",
-                "Views (excluding off-site video views)",
-                "Off-site Views",
-                "Clicks",
-                "Click-Through Rate (CTR)",
-                "Likes",
-                "Comments",
-                "Shares",
-                "Followers",
-                "Engagement Rate",
-                "Content Type",
-            ],
-            "followers_new": [
-                "Date",
-                "Followers Sponsored",
-                "Followers Organic",
-                "Total Followers",
-            ],
-            "followers_location": ["Location", "Total Followers"],
-            "followers_function": ["Function", "Total Followers"],
-            "followers_experience": ["Experience Level", "Total Followers"],
-            "followers_industry": ["Industry", "Total Followers"],
-            "followers_company_size": ["Company Size", "Total Followers"],
-            "visitors_metrics": [
-                "Date",
-                "Page Views Overview (Desktop)",
-                "Page Views Overview (Mobile Devices)",
-                "Page Views Overview (Total)",
-                "Unique Visitors Overview (Desktop)",
-                "Unique Visitors Overview (Mobile Devices)",
-                "Unique Visitors Overview (Total)",
-                "Page Views Day by Day (Desktop)",
-                "Page Views Day by Day (Mobile Devices)",
-                "Page Views Day by Day (Total)",
-                "Unique Visitors Day by Day (Desktop)",
-                "Unique Visitors Day by Day (Mobile Devices)",
-                "Unique Visitors Day by Day (Total)",
-                "Page Views Jobs (Desktop)",
-                "Page Views Jobs (Mobile Devices)",
-                "Page Views Jobs (Total)",
-                "Unique Visitors Jobs (Desktop)",
-                "Unique Visitors Jobs (Mobile Devices)",
-                "Unique Visitors Jobs (Total)",
-                "Total Page Views (Desktop)",
-                "Total Page Views (Mobile Devices)",
-                "Total Page Views (Total)",
-                "Total Unique Visitors (Desktop)",
-                "Total Unique Visitors (Mobile Devices)",
-                "Total Unique Visitors (Total)",
-            ],
-            "visitors_location": ["Location", "Total Views"],
-            "visitors_function": ["Function", "Total Views"],
-            "visitors_experience": ["Experience Level", "Total Views"],
-            "visitors_industry": ["Industry", "Total Views"],
-            "visitors_company_size": ["Company Size", "Total Views"],
-            "competitor": [
-                "Page",
-                "Total Followers",
-                "New Followers",
-                "Total Post Engagements",
-                "Total Posts",
-            ],
-        }
-
-        dataframe["df"].columns = translated_columns.get(dataframe["dataframe_name"])
+        columns = get_translated_columns(
+            dataframe["dataframe_name"], dataframe["usecols"]
+        )
+        dataframe["df"] = dataframe["df"].set_axis(columns, axis=1)
         return dataframe
 
-    def add_final_date(self, dataframe):
+    def get_final_date(self, year, month, period):
         """
-        Adiciona uma data final ao DataFrame com base no período de extração.
+        Calcula a data final de um período de extração.
 
         Parâmetros:
-        dataframe (dict): Dicionário contendo o DataFrame e suas informações.
+        year (str): Ano da extração.
+        month (str): Mês da extração, em português (e.g., 'Jan', 'Fev').
+        period (int): Quinzena da extração (1 ou 2).
 
         Retorno:
-        dict: O mesmo dicionário com a data final adicionada.
+        pd.Timestamp: Dia 15 para a primeira quinzena ou último dia do mês para a segunda.
         """
-        extraction_period = dataframe["extraction_period"]
-        year, month, period = extraction_period.split("-")
-
-        month_order_pt = {
-            "Jan": 1,
-            "Fev": 2,
-            "Mar": 3,
-            "Abr": 4,
-            "Maio": 5,
-            "Jun": 6,
-            "Jul": 7,
-            "Ago": 8,
-            "Set": 9,
-            "Out": 10,
-            "Nov": 11,
-            "Dez": 12,
-        }
-        month = month_order_pt[month]
-
-        if period == "2":
-            day = calendar.monthrange(int(year), int(month))[1]
+        month = MONTH_ORDER_PT[month]
+
+        if period == 2:
+            day = calendar.monthrange(int(year), month)[1]
         else:
             day = 15
 
-        final_date = f"{year}-{month}-{day}"
+        return pd.Timestamp(int(year), month, day)
+
+    def add_final_date(self, dataframe):
+        """
+        Adiciona uma data final ao DataFrame com base no período de extração.
+
+        Parâmetros:
+        dataframe (dict): Dicionário contendo o DataFrame e suas informações.
 
-        dataframe["df"]["Extraction Range"] = final_date
+        Retorno:
+        dict: O mesmo dicionário com a data final adicionada.
+        """
+        # Data calculada uma vez por arquivo, já como datetime
+        dataframe["df"]["Extraction Range"] = dataframe["final_date"]
         return dataframe
 
     def convert_column_types(self, dataframe):
@@ -309,18 +456,35 @@ class EtlLinkedinPandas:
         Retorno:
         dict: O mesmo dicionário com os tipos de dados das colunas convertidos.
         """
-        date_columns = {
-            "content_metrics": ["Date"],
-            "content_posts": ["Date", "Campaign Start Date", "Campaign End Date"],
-            "followers_new": ["Date"],
-            "visitors_metrics": ["Date"],
-        }
+        # Formato fixo das datas exportadas pelo LinkedIn: evita inferir o formato por valor
+        for column in DATE_COLUMNS.get(dataframe["dataframe_name"], ()):
+            dataframe["df"][column] = pd.to_datetime(
+                dataframe["df"][column], format="%m/%d/%Y", cache=True, errors="coerce"
+            )
+
+        # Texto convertido antes: abas vazias (ou colunas em branco) não são lidas como texto,
+        # e as categorias de todos os arquivos precisam do mesmo tipo para o concat
+        for column in CATEGORICAL_COLUMNS.get(dataframe["dataframe_name"], []):
+            dataframe["df"][column] = (
+                dataframe["df"][column].astype("string").astype("category")
+            )
+
+        return dataframe
+
+    def downcast_numeric_columns(self, dataframe):
+        """
+        Converte as colunas de métricas (contagens) para o tipo inteiro anulável Int32.
+
+        Parâmetros:
+        dataframe (dict): Dicionário contendo o DataFrame e suas informações.
 
-        columns_to_convert = date_columns.get(dataframe["dataframe_name"], [])
-        columns_to_convert.append("Extraction Range")
+        Retorno:
+        dict: O mesmo dicionário com as colunas de métricas convertidas.
+        """
+        df = dataframe["df"]
 
-        for column in columns_to_convert:
-            dataframe["df"][column] = pd.to_datetime(dataframe["df"][column])
+        for column in METRIC_COLUMNS.get(dataframe["dataframe_name"], ()):
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int32")
 
         return dataframe
 
@@ -342,84 +506,41 @@ class EtlLinkedinPandas:
                 "Reactions (total)",
                 "Comments (total)",
                 "Shares (total)",
-                "Engagement rate (total)",
                 "Extraction Range",
             ]
         ]
 
-        df["Reactions (positive)"] = df["Reactions (total)"][
-            df["Reactions (total)"] >= 0
-        ]
-        df["Comments (positive)"] = df["Comments (total)"][df["Comments (total)"] >= 0]
-        df["Shares (positive)"] = df["Shares (total)"][df["Shares (total)"] >= 0]
-        df["Clicks (positive)"] = df["Clicks (total)"][df["Clicks (total)"] >= 0]
-
-        df["Reactions (positive)"] = df["Reactions (positive)"].fillna(0)
-        df["Comments (positive)"] = df["Comments (positive)"].fillna(0)
-        df["Shares (positive)"] = df["Shares (positive)"].fillna(0)
-        df["Clicks (positive)"] = df["Clicks (positive)"].fillna(0)
-
-        window = 3
-
-        df["Reactions (moving average)"] = (
-            df["Reactions (positive)"].rolling(window=window).mean()
-        )
-        df["Comments (moving average)"] = (
-            df["Comments (positive)"].rolling(window=window).mean()
-        )
-        df["Shares (moving average)"] = (
-            df["Shares (positive)"].rolling(window=window).mean()
-        )
-        df["Clicks (moving average)"] = (
-            df["Clicks (positive)"].rolling(window=window).mean()
-        )
-
-        df["Reactions (total)"] = df.apply(
-            lambda row: (
-                row["Reactions (moving average)"]
-                if row["Reactions (total)"] < 0
-                else row["Reactions (total)"]
-            ),
-            axis=1,
-        )
-
-        df["Comments (total)"] = df.apply(
-            lambda row: (
-                row["Comments (moving average)"]
-                if row["Comments (total)"] < 0
-                else row["Comments (total)"]
-            ),
-            axis=1,
-        )
-
-        df["Shares (total)"] = df.apply(
-            lambda row: (
-                row["Shares (moving average)"]
-                if row["Shares (total)"] < 0
-                else row["Shares (total)"]
-            ),
-            axis=1,
+        # Valores negativos (ou vazios) contam como zero na média móvel
+        positives = (
+            df[
+                [
+                    "Reactions (total)",
+                    "Comments (total)",
+                    "Shares (total)",
+                    "Clicks (total)",
+                ]
+            ]
+            .clip(lower=0)
+            .fillna(0)
         )
 
-        df["Clicks (total)"] = df.apply(
-            lambda row: (
-                row["Clicks (moving average)"]
-                if row["Clicks (total)"] < 0
-                else row["Clicks (total)"]
-            ),
-            axis=1,
-        )
+        # Uma única janela móvel sobre as quatro colunas de uma vez
+        moving_average = positives.rolling(window=3).mean()
 
-        df["Engagement Rate (total)"] = df.apply(
-            lambda row: (
-                row["Reactions (total)"]
-                + row["Comments (total)"]
-                + row["Clicks (total)"]
-                + row["Shares (total)"]
+        # Valores negativos são substituídos pela média móvel (vetorizado)
+        for metric in ["Reactions", "Comments", "Shares", "Clicks"]:
+            total = df[f"{metric} (total)"].astype("Float64")
+            # Totais vazios (NA) não são negativos: continuam vazios
+            df[f"{metric} (total)"] = total.mask(
+                total.lt(0).fillna(False), moving_average[f"{metric} (total)"]
             )
-            / row["Impressions (total)"],
-            axis=1,
-        )
+
+        df["Engagement Rate (total)"] = (
+            df["Reactions (total)"]
+            + df["Comments (total)"]
+            + df["Clicks (total)"]
+            + df["Shares (total)"]
+        ) / df["Impressions (total)"]
 
         dataframe["df"] = df[
             [
@@ -451,11 +572,35 @@ class EtlLinkedinPandas:
             dataframe = self.translate_cols(dataframe)
             dataframe = self.add_final_date(dataframe)
             dataframe = self.convert_column_types(dataframe)
+            dataframe = self.downcast_numeric_columns(dataframe)
             if dataframe["dataframe_name"] == "content_metrics":
                 dataframe = self.clean_content_metrics_data(dataframe)
 
         return data
 
+    def load_dataframe_to_clean(self, dataframe):
+        """
+        Grava um DataFrame transformado (uma quinzena) no diretório de dados limpos.
+
+        Parâmetros:
+        dataframe (dict): Dicionário contendo o DataFrame e suas informações.
+        """
+        dir_export = os.path.join(self.clean_directory, *dataframe["dir"])
+        self.make_directory(dir_export)
+
+        export_filename = (
+            dataframe["dataframe_name"]
+            + "_"
+            + dataframe["extraction_period"].split("-")[-1]
+            + ".csv"
+        )
+
+        dataframe["df"].to_csv(
+            os.path.join(dir_export, export_filename),
+            index=False,
+            quoting=csv.QUOTE_ALL,
+        )
+
     def load_to_clean(self, data):
         """
         Carrega os dados transformados no diretório de dados limpos.
@@ -467,60 +612,71 @@ class EtlLinkedinPandas:
         int: Retorna 1 se a carga for bem-sucedida.
         """
         for dataframe in data:
-            dir_export = os.path.join(self.clean_directory, *dataframe["dir"])
-            if not os.path.exists(dir_export):
-                os.makedirs(dir_export)
-
-            export_filename = (
-                dataframe["dataframe_name"]
-                + "_"
-                + dataframe["extraction_period"].split("-")[-1]
-                + ".csv"
-            )
-
-            dataframe["df"].to_csv(
-                os.path.join(dir_export, export_filename),
-                index=False,
-                quoting=csv.QUOTE_ALL,
-            )
+            self.load_dataframe_to_clean(dataframe)
 
         return 1
 
-    def concatenate_monthly_dataframes(self, data):
+    def concatenate_monthly_dataframes(self, data, load_to_clean=False):
         """
         Agrupa e concatena os DataFrames extraídos por mês.
 
         Parâmetros:
         data (list): Lista de dicionários contendo os dados extraídos.
+        load_to_clean (bool): Grava cada quinzena no diretório de dados limpos durante o agrupamento,
+            dispensando a chamada separada de load_to_clean.
 
         Retorno:
         dict: Dicionário com os DataFrames concatenados, categoria e diretório de saída.
         """
-        grouped_data_month = {}
+        grouped_data_category = {}
 
+        # Um único pd.concat por categoria; os meses são separados depois por groupby
         for dataframe in data:
-            year_month = "_".join(dataframe["extraction_period"].split("-")[:2])
-            tag_month = f"{year_month}_{dataframe['dataframe_name']}"
+            if load_to_clean:
+                self.load_dataframe_to_clean(dataframe)
 
-            if tag_month not in grouped_data_month:
-                grouped_data_month[tag_month] = {
-                    "category": dataframe["dataframe_name"],
-                    "export_dir": os.path.join(self.clean_directory, *dataframe["dir"]),
-                    "dfs": [],
-                }
+            year_month = "_".join(dataframe["extraction_period"].split("-")[:2])
+            category = dataframe["dataframe_name"]
 
-            grouped_data_month[tag_month]["dfs"].append(dataframe["df"])
+            if category not in grouped_data_category:
+                grouped_data_category[category] = {"dfs": [], "export_dirs": {}}
 
-        for tag_month, grouped_data in grouped_data_month.items():
-            grouped_data_month[tag_month]["concatenated_df"] = pd.concat(
-                grouped_data["dfs"]
+            grouped_data_category[category]["dfs"].append(
+                dataframe["df"].assign(_year_month=year_month)
+            )
+            grouped_data_category[category]["export_dirs"][year_month] = os.path.join(
+                self.clean_directory, *dataframe["dir"]
             )
 
+        grouped_data_month = {}
+        for category, grouped_data in grouped_data_category.items():
+            dfs = grouped_data["dfs"]
+
+            # Categorias unificadas antes do concat para manter o tipo categórico
+            for column in CATEGORICAL_COLUMNS.get(category, []):
+                categories = union_categoricals([df[column] for df in dfs]).categories
+                for df in dfs:
+                    df[column] = df[column].cat.set_categories(categories)
+
+            category_df = pd.concat(dfs, ignore_index=True)
+
+            month_dfs = dict(iter(category_df.groupby("_year_month", sort=False)))
+
+            # Meses só com abas vazias não formam grupo: recebem um DataFrame vazio
+            for year_month, export_dir in grouped_data["export_dirs"].items():
+                month_df = month_dfs.get(year_month, category_df.iloc[0:0])
+                grouped_data_month[f"{year_month}_{category}"] = {
+                    "category": category,
+                    "export_dir": export_dir,
+                    "concatenated_df": month_df.drop(columns="_year_month"),
+                    "category_df": category_df,
+                }
+
         return grouped_data_month
 
     def export_dataframes(self, data, file_prefix):
         """
-        Exporta dataframes concatenados para um arquivo CSV.
+        Exporta dataframes concatenados para um arquivo Parquet.
 
         Parâmetros:
         data (dict): Dicionário com os DataFrames concatenados.
@@ -531,20 +687,19 @@ class EtlLinkedinPandas:
         """
         for key, dataframe in data.items():
             export_dir = dataframe["export_dir"]
-            export_filename = f"{file_prefix}_{dataframe['category']}.csv"
+            export_filename = f"{file_prefix}_{dataframe['category']}.parquet"
 
-            if os.path.exists(export_dir) == False:
-                os.makedirs(export_dir)
+            self.make_directory(export_dir)
 
             full_path = os.path.join(export_dir, export_filename)
-            dataframe["concatenated_df"].to_csv(
-                full_path, index=False, quoting=csv.QUOTE_ALL
+            dataframe["concatenated_df"].to_parquet(
+                full_path, index=False, compression="zstd"
             )
         return 1
 
     def concatenate_category_dataframes(self, data):
         """
-        Concatena todos os arquivos concatenados mensalmente em arquivos únicos por categoria.
+        Retorna os DataFrames únicos por categoria, concatenados na etapa mensal.
 
         Parâmetros:
         clean_data (dict): Dicionário de listas de arquivos mensais limpos a serem concatenados.
@@ -554,6 +709,7 @@ class EtlLinkedinPandas:
         """
         grouped_data_category = {}
 
+        # Reaproveita o DataFrame da categoria já concatenado na etapa mensal
         for key, dataframe in data.items():
             if dataframe["category"] not in grouped_data_category:
                 grouped_data_category[dataframe["category"]] = {
@@ -561,18 +717,11 @@ class EtlLinkedinPandas:
                     "export_dir": os.path.join(
                         self.clean_directory, "concatenated_dataframes"
                     ),
-                    "dfs": [],
+                    "concatenated_df": dataframe["category_df"].drop(
+                        columns="_year_month"
+                    ),
                 }
 
-            grouped_data_category[dataframe["category"]]["dfs"].append(
-                dataframe["concatenated_df"]
-            )
-
-        for category, grouped_data in grouped_data_category.items():
-            grouped_data_category[category]["concatenated_df"] = pd.concat(
-                grouped_data["dfs"]
-            )
-
         return grouped_data_category
     
     ## Metodo 2
@@ -583,7 +732,9 @@ class EtlLinkedinPandas:
             clean_data.append(
                 {
                     "filename": filename,
-                    "df": pd.read_csv(os.path.join(clean_concatenated_path, filename)),
+                    "df": pd.read_parquet(
+                        os.path.join(clean_concatenated_path, filename)
+                    ),
                 }
             )
 
@@ -599,9 +750,11 @@ def main():
     etl = EtlLinkedinPandas(raw_directory, clean_directory)
     data = etl.extract_data()
     data = etl.transform_data(data)
-    etl.load_to_clean(data)
 
-    concatenated_monthly_dataframes = etl.concatenate_monthly_dataframes(data)
+    # As quinzenas são gravadas no mesmo laço que agrupa os dados por mês
+    concatenated_monthly_dataframes = etl.concatenate_monthly_dataframes(
+        data, load_to_clean=True
+    )
     etl.export_dataframes(concatenated_monthly_dataframes, file_prefix="month")
 
     concatenated_category_dataframes = etl.concatenate_category_dataframes(
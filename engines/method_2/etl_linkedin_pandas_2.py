@@ -441,8 +441,8 @@ class EtlLinkedinPandas:
             dataframe = {}
             dataframe["dataframe_name"] = filename.replace(
                 concatenated_file_prefix, ""
-            ).replace(".csv", "")
-            dataframe["df"] = pd.read_csv(
+            ).replace(".parquet", "")
+            dataframe["df"] = pd.read_parquet(
                 os.path.join(self.clean_concatenated_directory, filename)
             )
             dataframe = self.convert_column_types(dataframe)
@@ -3,7 +3,7 @@ import os
 import time
 import pandas as pd
 from engines.method_1.etl_linkedin_duckdb import EtlLinkedinDuckDb
-from engines.method_1.etl_linkedin_pandas import EtlLinkedinPandas
+from engines.method_1.etl_linkedin_pandas import EtlLinkedinPandas, TRANSLATED_COLUMNS
 from engines.method_1.etl_linkedin_polars import EtlLinkedinPolars
 import gc
 
@@ -77,7 +77,8 @@ def save_environment_metrics(
     total_rows = 0
 
     for dataframe in data:
-        total_columns += dataframe["df"].shape[1]
+        # Conta as colunas da aba inteira, mesmo as não lidas (usecols)
+        total_columns += len(TRANSLATED_COLUMNS[dataframe["dataframe_name"]])
         total_rows += dataframe["df"].shape[0]
 
     environment_metrics = {
@@ -185,7 +186,7 @@ class EtlLinkedin:
         Função para iniciar o processo de exportação dos dados da engine.
         """
         if self.engine == "duckdb":
-            self.etl.export_tables(data, "month")
+            self.etl.export_tables(data, "month", file_format="parquet")
         else:
             self.etl.export_dataframes(data, file_prefix="month")
 
@@ -0,0 +1,59 @@
+import unittest
+
+import pandas as pd
+
+from engines.method_1.etl_linkedin_duckdb import EtlLinkedinDuckDb
+
+
+def followers_industry_dataframe(extraction_period, industries):
+    """
+    Monta uma aba followers_industry como lida do Excel.
+    """
+    df = pd.DataFrame(
+        {
+            "Industry": industries,
+            "Total Followers": range(1, len(industries) + 1),
+        }
+    )
+    return {
+        "dataframe_name": "followers_industry",
+        "dir": ["Seguidores", "2024", extraction_period.split("_")[1]],
+        "extraction_period": extraction_period,
+        "df": df,
+    }
+
+
+class TestToArrow(unittest.TestCase):
+    def setUp(self):
+        self.etl = EtlLinkedinDuckDb("_", "_", memory_limit="1GB")
+
+    def test_category_table_is_handed_to_pandas(self):
+        tables = self.etl.convert_dataframes_to_duckdb(
+            [
+                followers_industry_dataframe("2024_Jan_1", ["Tech", "Retail"]),
+                followers_industry_dataframe("2024_Jan_2", ["Tech"]),
+            ]
+        )
+        monthly_data = self.etl.concatenate_monthly_tables(tables)
+        self.etl.concatenate_category_tables(monthly_data)
+
+        df = (
+            self.etl.to_arrow("followers_industry")
+            .to_pandas()
+            .sort_values(["Extraction Range", "Industry"], ignore_index=True)
+        )
+
+        self.assertEqual(df["Industry"].tolist(), ["Retail", "Tech", "Tech"])
+        self.assertEqual(df["Total Followers"].tolist(), [2, 1, 1])
+        self.assertEqual(
+            pd.to_datetime(df["Extraction Range"]).tolist(),
+            [
+                pd.Timestamp(2024, 1, 15),
+                pd.Timestamp(2024, 1, 15),
+                pd.Timestamp(2024, 1, 31),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
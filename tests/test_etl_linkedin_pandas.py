@@ -0,0 +1,115 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from engines.method_1.etl_linkedin_pandas import EtlLinkedinPandas
+
+
+def content_metrics_dataframe(comments):
+    """
+    Monta uma aba content_metrics já traduzida, com as colunas lidas do Excel.
+    """
+    size = len(comments)
+    df = pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-01", periods=size),
+            "Impressions (total)": [100] * size,
+            "Clicks (total)": [10] * size,
+            "Reactions (total)": [20] * size,
+            "Comments (total)": comments,
+            "Shares (total)": [5] * size,
+            "Extraction Range": pd.Timestamp(2024, 1, 15),
+        }
+    )
+    return {"dataframe_name": "content_metrics", "df": df}
+
+
+class TestCleanContentMetricsData(unittest.TestCase):
+    def setUp(self):
+        self.etl = EtlLinkedinPandas("_", "_")
+
+    def clean(self, comments):
+        dataframe = content_metrics_dataframe(comments)
+        dataframe = self.etl.downcast_numeric_columns(dataframe)
+        return self.etl.clean_content_metrics_data(dataframe)["df"]
+
+    def test_blank_total_stays_blank(self):
+        df = self.clean([4, 6, 8, np.nan, 2])
+
+        self.assertTrue(pd.isna(df["Comments (total)"].iloc[3]))
+        self.assertTrue(pd.isna(df["Engagement Rate (total)"].iloc[3]))
+
+    def test_negative_total_is_replaced_by_moving_average(self):
+        df = self.clean([4, 6, 8, -1, 2])
+
+        # Média móvel dos três últimos dias, com o negativo contado como zero: (6 + 8 + 0) / 3
+        self.assertAlmostEqual(df["Comments (total)"].iloc[3], 14 / 3)
+
+    def test_metric_columns_are_int32(self):
+        dataframe = self.etl.downcast_numeric_columns(
+            content_metrics_dataframe([4, 6, 8, np.nan, 2])
+        )
+
+        self.assertEqual(dataframe["df"]["Impressions (total)"].dtype, "Int32")
+        self.assertEqual(dataframe["df"]["Comments (total)"].dtype, "Int32")
+
+
+
+def followers_industry_dataframe(extraction_period, industries):
+    """
+    Monta uma aba followers_industry já traduzida; sem indústrias, a aba tem só o cabeçalho.
+    """
+    df = pd.DataFrame(
+        {
+            "Industry": pd.Series(industries, dtype=object),
+            "Total Followers": pd.Series(range(len(industries)), dtype=float),
+        }
+    )
+    return {
+        "dataframe_name": "followers_industry",
+        "dir": ["Seguidores", "2024", extraction_period.split("-")[1]],
+        "extraction_period": extraction_period,
+        "df": df,
+    }
+
+
+class TestConcatenateMonthlyDataframes(unittest.TestCase):
+    def setUp(self):
+        self.etl = EtlLinkedinPandas("_", "_")
+
+    def concatenate(self, dataframes):
+        data = [self.etl.convert_column_types(dataframe) for dataframe in dataframes]
+        return self.etl.concatenate_monthly_dataframes(data)
+
+    def test_empty_sheet_is_concatenated_with_categorical_keys(self):
+        monthly = self.concatenate(
+            [
+                followers_industry_dataframe("2024-Jan-1", []),
+                followers_industry_dataframe("2024-Jan-2", ["Tech", "Retail"]),
+            ]
+        )
+
+        df = monthly["2024_Jan_followers_industry"]["concatenated_df"]
+        self.assertEqual(df["Industry"].dtype, "category")
+        self.assertEqual(df["Industry"].tolist(), ["Tech", "Retail"])
+
+    def test_month_with_only_empty_sheets_is_kept(self):
+        monthly = self.concatenate(
+            [
+                followers_industry_dataframe("2024-Jan-1", []),
+                followers_industry_dataframe("2024-Jan-2", []),
+                followers_industry_dataframe("2024-Fev-1", ["Tech"]),
+            ]
+        )
+
+        self.assertEqual(
+            list(monthly), ["2024_Jan_followers_industry", "2024_Fev_followers_industry"]
+        )
+        df = monthly["2024_Jan_followers_industry"]["concatenated_df"]
+        self.assertTrue(df.empty)
+        self.assertEqual(list(df.columns), ["Industry", "Total Followers"])
+
+
+if __name__ == "__main__":
+    unittest.main()